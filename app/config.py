@@ -2,12 +2,34 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Dict, Type
-from urllib.parse import urlencode
+from types import MappingProxyType
+from typing import Mapping, Optional, Type
+from urllib.parse import quote_plus
 
 from pydantic import Field, HttpUrl
 
 
+# Read-only template; each Settings instance receives its own copy.
+_DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "Accept": "*/*",
+        "Sec-Fetch-Site": "cross-site",
+        "Origin": "https://www.livesport.cz",
+        "Sec-Fetch-Dest": "empty",
+        "Accept-Language": "cs-CZ,cs;q=0.9",
+        "Sec-Fetch-Mode": "cors",
+        "User-Agent": (
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/605.1.15 (KHTML, like Gecko) "
+            "Version/18.3.1 Safari/605.1.15"
+        ),
+        "Accept-Encoding": "gzip, deflate, br",
+        "Referer": "https://www.livesport.cz/",
+        "Priority": "u=3, i",
+    }
+)
+
+
 class _SettingsFields:
     """Shared field definitions for the application settings."""
 
@@ -31,37 +53,45 @@ class _SettingsFields:
         "CZ10",
         description="Geo IP subdivision code parameter for the odds endpoint.",
     )
-    default_headers: Dict[str, str] = Field(
-        default_factory=lambda: {
-            "Accept": "*/*",
-            "Sec-Fetch-Site": "cross-site",
-            "Origin": "https://www.livesport.cz",
-            "Sec-Fetch-Dest": "empty",
-            "Accept-Language": "cs-CZ,cs;q=0.9",
-            "Sec-Fetch-Mode": "cors",
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/605.1.15 (KHTML, like Gecko) "
-                "Version/18.3.1 Safari/605.1.15"
-            ),
-            "Accept-Encoding": "gzip, deflate, br",
-            "Referer": "https://www.livesport.cz/",
-            "Priority": "u=3, i",
-        },
+    default_headers: Mapping[str, str] = Field(
+        default_factory=lambda: dict(_DEFAULT_HEADERS),
         description="Default headers sent to the odds endpoint.",
     )
 
     def build_odds_url(self, event_id: str) -> str:
         """Construct the odds endpoint URL for the provided event."""
 
-        query_params = {
-            "_hash": self.odds_hash,
-            "eventId": event_id,
-            "projectId": str(self.project_id),
-            "geoIpCode": self.geo_ip_code,
-            "geoIpSubdivisionCode": self.geo_ip_subdivision_code,
-        }
-        return f"{self.odds_endpoint_base}?{urlencode(query_params)}"
+        prefix = _odds_url_prefix(
+            str(self.odds_endpoint_base),
+            self.odds_hash,
+            self.project_id,
+            self.geo_ip_code,
+            self.geo_ip_subdivision_code,
+        )
+        return prefix + quote_plus(event_id)
+
+
+@lru_cache
+def _odds_url_prefix(
+    endpoint_base: str,
+    odds_hash: str,
+    project_id: int,
+    geo_ip_code: str,
+    geo_ip_subdivision_code: str,
+) -> str:
+    """Return the encoded odds URL up to, and including, the ``eventId=`` key.
+
+    Only the event identifier changes between requests, so the static part of
+    the query string is encoded once per distinct settings combination.
+    """
+
+    return (
+        f"{endpoint_base}?_hash={quote_plus(odds_hash)}"
+        f"&projectId={project_id}"
+        f"&geoIpCode={quote_plus(geo_ip_code)}"
+        f"&geoIpSubdivisionCode={quote_plus(geo_ip_subdivision_code)}"
+        "&eventId="
+    )
 
 
 def _get_base_settings_class() -> Type[_SettingsFields]:
@@ -100,11 +130,16 @@ def _get_base_settings_class() -> Type[_SettingsFields]:
     return SettingsBase
 
 
+# Resolved once at import time so the optional-dependency probe is not repeated.
 Settings: Type[_SettingsFields] = _get_base_settings_class()
 
+_SETTINGS: Optional[_SettingsFields] = None
+
 
-@lru_cache
 def get_settings() -> _SettingsFields:
-    """Return a cached Settings instance."""
+    """Return the process-wide Settings instance, creating it on first use."""
 
-    return Settings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings()
+    return _SETTINGS
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import sys
+import time
 from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
 
 from app.schemas.odds import (
     BookmakerOdds,
@@ -13,16 +18,140 @@ from app.schemas.odds import (
 )
 
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+# Callable used to materialise each schema level: a model class plus its field values.
+_Builder = Callable[..., Any]
+
+_MISSING = object()
+
+_DT_FORMATS = ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S%z")
+
+_OUTCOME_LABEL_KEYS = ("name", "label", "displayName", "text")
+_OUTCOME_SELECTION_KEYS = ("key", "selectionKey", "outcomeKey")
+_OUTCOME_DECIMAL_KEYS = ("oddsDecimal", "decimalOdds", "value")
+_OUTCOME_FRACTIONAL_KEYS = ("oddsFractional", "fractionalOdds")
+_OUTCOME_PROBABILITY_KEYS = ("probability", "impliedProbability")
+_MARKET_NAME_KEYS = ("name", "marketName", "label", "text")
+_MARKET_KEY_KEYS = ("key", "marketKey")
+_BOOKMAKER_NAME_KEYS = ("name", "bookmakerName", "label")
+_BOOKMAKER_REGION_KEYS = ("region", "country", "jurisdiction")
+_EVENT_START_KEYS = ("startTime", "startTimestamp", "kickoff", "startDate")
+_EVENT_NAME_KEYS = ("name", "eventName", "shortName", "eventLabel", "eventTitle")
+_EVENT_COMPETITION_KEYS = ("competition", "tournament", "league", "competitionName")
+_EVENT_INFO_NODE_KEYS = ("event", "fixture", "details")
+_SOURCE_KEYS = ("source", "provider", "origin")
+_TEXT_KEYS_REVERSED = tuple(reversed(("text", "label", "name", "value", "displayName")))
+_BOOKMAKER_LIST_KEYS = ("bookmakers", "bookmakerOdds", "odds")
+_BOOKMAKER_MARKET_LIST_KEYS = ("markets", "marketGroups", "groups")
+_MARKET_OUTCOME_LIST_KEYS = ("outcomes", "selections")
+_GRAPHQL_BOOKMAKER_LIST_KEYS = ("bookmakers",)
+_GRAPHQL_ODDS_LIST_KEYS = ("odds",)
+
+# Key sets used to recognise interesting nodes while walking a payload; the
+# ``dict.keys()`` view intersects with them in C.
+_EVENT_SIGNAL_KEYS = frozenset(
+    {"bookmakers", "bookmakerOdds", "odds", "event", "fixture", "details", "eventDetails"}
+)
+_EVENT_INFO_KEYS = frozenset(
+    {
+        "name",
+        "eventName",
+        "shortName",
+        "competition",
+        "tournament",
+        "league",
+        "competitionName",
+        "startTime",
+        "startTimestamp",
+        "kickoff",
+        "startDate",
+    }
+)
+_EVENT_NODE_CANDIDATES = ("event", "eventOdds", "eventOddsV2", "event_data", "eventOddsResponse")
+
+_TYPE_MAPPING = {
+    "HOME_DRAW_AWAY": "1X2",
+    "DOUBLE_CHANCE": "Double Chance",
+    "DRAW_NO_BET": "Draw No Bet",
+    "OVER_UNDER": "Over/Under",
+    "ASIAN_HANDICAP": "Asian Handicap",
+    "EUROPEAN_HANDICAP": "European Handicap",
+    "HALF_FULL_TIME": "Half-Time/Full-Time",
+    "CORRECT_SCORE": "Correct Score",
+    "BOTH_TEAMS_TO_SCORE": "Both Teams To Score",
+    "ODD_OR_EVEN": "Odd or Even",
+}
+_SCOPE_MAPPING = {
+    "FULL_TIME": "Full Time",
+    "FIRST_HALF": "First Half",
+    "SECOND_HALF": "Second Half",
+    "UNKNOWN": "Market",
+}
+
+# Non-numeric odds placeholders ("-", "N/A", "SP", ...) seen so far. They form a
+# small vocabulary, so remembering them avoids raising ValueError on every repeat
+# while ``float()`` stays the single source of truth for what parses.
+_NON_NUMERIC_STRINGS: Set[str] = set()
+_NON_NUMERIC_STRINGS_MAX = 1024
+
+# ``retrieved_at`` is informational, so the wall clock is sampled at most this often.
+_CLOCK_RESOLUTION_SECONDS = 0.1
+# [monotonic time of the last sample, UTC datetime sampled at that point]
+_clock_sample: List[Any] = [float("-inf"), None]
+
+_MATCH_EVENT_INFO = 0b01
+_MATCH_BOOKMAKERS = 0b10
+
+
+# Underlying function of the classmethod that builds a model without validation,
+# resolved once: Pydantic v2 calls it ``model_construct``, v1 ``construct``.
+_MODEL_CONSTRUCT: Callable[..., Any] = (
+    getattr(BaseModel, "model_construct", None) or BaseModel.construct
+).__func__  # type: ignore[union-attr]
+
+
+def _construct(model: Type[_ModelT], **values: Any) -> _ModelT:
+    """Build ``model`` from already-normalised values without re-validating them."""
+
+    return _MODEL_CONSTRUCT(model, **values)
+
+
+def _as_dict(model: Type[BaseModel], **values: Any) -> Dict[str, Any]:
+    """Builder that skips the model entirely and returns its fields as a dict."""
+
+    return values
+
+
+def _cached_now() -> datetime:
+    """Return the current UTC time, reusing the last sample within ``_CLOCK_RESOLUTION_SECONDS``."""
+
+    now = time.monotonic()
+    if now - _clock_sample[0] > _CLOCK_RESOLUTION_SECONDS:
+        _clock_sample[0] = now
+        _clock_sample[1] = datetime.now(tz=timezone.utc)
+    return _clock_sample[1]
+
+
 def _ensure_list(value: Any) -> List[Any]:
-    if isinstance(value, list):
+    if type(value) is list:
         return value
     if value is None:
         return []
     return [value]
 
 
+def _first_list(data: Dict[str, Any], keys: Tuple[str, ...]) -> Sequence[Any]:
+    """Return the first truthy value under ``keys`` wrapped as a list, else ``()``."""
+
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value if type(value) is list else [value]
+    return ()
+
+
 def _parse_datetime(value: Any) -> Optional[datetime]:
-    if value in (None, ""):
+    if value is None or value == "":
         return None
     if isinstance(value, datetime):
         return value
@@ -36,228 +165,264 @@ def _parse_datetime(value: Any) -> Optional[datetime]:
         except (OverflowError, ValueError):
             return None
     if isinstance(value, str):
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S%z"):
-            try:
-                dt = datetime.strptime(value, fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt.astimezone(timezone.utc)
-            except ValueError:
-                continue
+        normalised = value[:-1] + "+00:00" if value.endswith("Z") else value
         try:
-            return datetime.fromisoformat(value)
+            dt = datetime.fromisoformat(normalised)
         except ValueError:
-            return None
+            dt = None
+        if dt is None:
+            # ``fromisoformat`` covers the common upstream shapes; ``strptime`` is
+            # only kept for the rarer layouts it does not understand.
+            for fmt in _DT_FORMATS:
+                try:
+                    dt = datetime.strptime(value, fmt)
+                except ValueError:
+                    continue
+                break
+            else:
+                return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
     return None
 
 
-def _extract_first(data: Dict[str, Any], *keys: str) -> Any:
+def _extract_first(data: Any, keys: Tuple[str, ...]) -> Any:
+    if type(data) is not dict:
+        return None
     for key in keys:
-        if isinstance(data, dict) and key in data:
-            return data[key]
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
     return None
 
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    # Market keys, bookmaker names and outcome labels come from a small, highly
+    # repeated vocabulary; interning lets memoised responses share one copy.
+    return sys.intern(value) if value is not None else None
+
+
 def _safe_dict(value: Any) -> Dict[str, Any]:
-    return value if isinstance(value, dict) else {}
+    # Payloads come straight from the JSON decoder, so exact ``type() is`` checks
+    # are used for containers throughout this module instead of ``isinstance``.
+    return value if type(value) is dict else {}
 
 
 def _extract_text(value: Any) -> Optional[str]:
-    if value in (None, ""):
-        return None
-    if isinstance(value, str):
-        return value
-    if isinstance(value, (int, float)):
-        return str(value)
-    if isinstance(value, dict):
-        for key in ("text", "label", "name", "value", "displayName"):
-            if key in value:
-                extracted = _extract_text(value[key])
-                if extracted:
-                    return extracted
-        return None
-    if isinstance(value, (list, tuple)):
-        for item in value:
-            extracted = _extract_text(item)
-            if extracted:
-                return extracted
-        return None
-    return str(value)
+    """Return the first non-empty text found in ``value``.
+
+    Nested dicts and lists are searched depth-first with an explicit stack; items
+    are pushed in reverse so candidates are still tried in their original order.
+    """
+
+    if type(value) is str:
+        return value or None
+
+    stack: List[Any] = [value]
+    while stack:
+        current = stack.pop()
+        if current is None or current == "":
+            continue
+        if isinstance(current, str):
+            return current
+        if isinstance(current, (int, float)):
+            return str(current)
+        if isinstance(current, dict):
+            stack.extend(current[key] for key in _TEXT_KEYS_REVERSED if key in current)
+        elif isinstance(current, (list, tuple)):
+            stack.extend(reversed(current))
+        else:
+            text = str(current)
+            if text:
+                return text
+    return None
 
 
 def _stringify(value: Any) -> Optional[str]:
-    if value in (None, ""):
+    if type(value) is str:
+        return value or None
+    if value is None:
         return None
     return str(value)
 
 
 def _walk_nodes(root: Any) -> Iterable[Dict[str, Any]]:
-    """Yield dictionaries found in the payload via breadth-first search."""
+    """Yield dictionaries found in the payload via breadth-first search.
+
+    Shallower nodes always come first, so lookups that stop at the first match
+    pick the node closest to the root.
+    """
 
     queue: deque[Any] = deque([root])
     while queue:
         current = queue.popleft()
-        if isinstance(current, dict):
+        if type(current) is dict:
             yield current
             queue.extend(current.values())
-        elif isinstance(current, list):
+        elif type(current) is list:
             queue.extend(current)
 
 
+def _walk_collect(root: Any, wanted: int) -> Iterable[Tuple[Dict[str, Any], int]]:
+    """Yield ``(node, matched)`` pairs for dictionaries matching any ``wanted`` category.
+
+    ``matched`` is a bitmask of ``_MATCH_EVENT_INFO`` / ``_MATCH_BOOKMAKERS`` so a
+    caller can gather every target it needs from one traversal of the payload.
+    """
+
+    for node in _walk_nodes(root):
+        matched = 0
+        if wanted & _MATCH_EVENT_INFO and not node.keys().isdisjoint(_EVENT_INFO_KEYS):
+            matched |= _MATCH_EVENT_INFO
+        if wanted & _MATCH_BOOKMAKERS and _first_list(node, _BOOKMAKER_LIST_KEYS):
+            matched |= _MATCH_BOOKMAKERS
+        if matched:
+            yield node, matched
+
+
 def _extract_event_node(payload: Dict[str, Any]) -> Dict[str, Any]:
-    candidates: Iterable[str] = (
-        "event",
-        "eventOdds",
-        "eventOddsV2",
-        "event_data",
-        "eventOddsResponse",
-    )
     working = _safe_dict(payload.get("data")) or _safe_dict(payload)
-    for candidate in candidates:
+    for candidate in _EVENT_NODE_CANDIDATES:
         node = working.get(candidate)
-        if isinstance(node, dict):
+        if type(node) is dict:
             return node
 
     for node in _walk_nodes(working):
-        if any(
-            key in node
-            for key in (
-                "bookmakers",
-                "bookmakerOdds",
-                "odds",
-                "event",
-                "fixture",
-                "details",
-                "eventDetails",
-            )
-        ):
+        if not node.keys().isdisjoint(_EVENT_SIGNAL_KEYS):
             return node
 
     return working
 
 
-def _normalise_outcomes(raw_outcomes: Iterable[Dict[str, Any]]) -> List[OddsOutcome]:
-    outcomes: List[OddsOutcome] = []
+def _normalise_outcomes(raw_outcomes: Iterable[Any], build: _Builder = _construct) -> List[Any]:
+    outcomes: List[Any] = []
     for outcome in raw_outcomes:
-        if not isinstance(outcome, dict):
+        if type(outcome) is not dict:
             continue
         outcomes.append(
-            OddsOutcome(
+            build(
+                OddsOutcome,
                 id=_stringify(outcome.get("id") or outcome.get("outcomeId")),
-                label=_extract_text(_extract_first(outcome, "name", "label", "displayName", "text")),
-                selection_key=_stringify(_extract_first(outcome, "key", "selectionKey", "outcomeKey")),
-                odds_decimal=_try_parse_float(_extract_first(outcome, "oddsDecimal", "decimalOdds", "value")),
-                odds_fractional=_extract_first(outcome, "oddsFractional", "fractionalOdds"),
-                probability=_try_parse_float(_extract_first(outcome, "probability", "impliedProbability")),
+                label=_intern(_extract_text(_extract_first(outcome, _OUTCOME_LABEL_KEYS))),
+                selection_key=_intern(_stringify(_extract_first(outcome, _OUTCOME_SELECTION_KEYS))),
+                odds_decimal=_try_parse_float(_extract_first(outcome, _OUTCOME_DECIMAL_KEYS)),
+                odds_fractional=_stringify(_extract_first(outcome, _OUTCOME_FRACTIONAL_KEYS)),
+                probability=_try_parse_float(_extract_first(outcome, _OUTCOME_PROBABILITY_KEYS)),
             )
         )
     return outcomes
 
 
 def _try_parse_float(value: Any) -> Optional[float]:
-    if value in (None, ""):
-        return None
-    if isinstance(value, (int, float)):
+    # Exact type checks first: upstream odds are overwhelmingly plain floats,
+    # ints or numeric strings.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
         return float(value)
+    if value is None or value == "":
+        return None
     if isinstance(value, str):
+        if value in _NON_NUMERIC_STRINGS:
+            return None
         try:
             return float(value)
         except ValueError:
+            if len(_NON_NUMERIC_STRINGS) < _NON_NUMERIC_STRINGS_MAX:
+                _NON_NUMERIC_STRINGS.add(value)
             return None
+    if isinstance(value, (int, float)):
+        return float(value)
     return None
 
 
-def _normalise_markets(raw_markets: Iterable[Dict[str, Any]]) -> List[OddsMarket]:
-    markets: List[OddsMarket] = []
+def _normalise_markets(raw_markets: Iterable[Any], build: _Builder = _construct) -> List[Any]:
+    markets: List[Any] = []
     for market in raw_markets:
-        if not isinstance(market, dict):
+        if type(market) is not dict:
             continue
-        outcomes = _normalise_outcomes(_ensure_list(market.get("outcomes") or market.get("selections") or []))
+        outcomes = _normalise_outcomes(_first_list(market, _MARKET_OUTCOME_LIST_KEYS), build)
         markets.append(
-            OddsMarket(
+            build(
+                OddsMarket,
                 id=_stringify(market.get("id") or market.get("marketId")),
-                name=_extract_text(_extract_first(market, "name", "marketName", "label", "text")),
-                key=_stringify(_extract_first(market, "key", "marketKey")),
+                name=_intern(_extract_text(_extract_first(market, _MARKET_NAME_KEYS))),
+                key=_intern(_stringify(_extract_first(market, _MARKET_KEY_KEYS))),
                 outcomes=outcomes,
             )
         )
     return markets
 
 
-def _normalise_bookmakers(raw_bookmakers: Iterable[Dict[str, Any]]) -> List[BookmakerOdds]:
-    bookmaker_map: Dict[str, Dict[str, Any]] = {}
-    order: List[str] = []
+def _normalise_bookmakers(raw_bookmakers: Iterable[Any], build: _Builder = _construct) -> List[Any]:
+    # Column-per-field aggregation keyed by bookmaker; ``ids`` also records the
+    # first-seen order because dicts preserve insertion order.
+    ids: Dict[str, Optional[str]] = {}
+    names: Dict[str, Optional[str]] = {}
+    regions: Dict[str, Optional[str]] = {}
+    markets_by_key: Dict[str, List[Any]] = {}
 
     for bookmaker in raw_bookmakers:
-        if not isinstance(bookmaker, dict):
+        if type(bookmaker) is not dict:
             continue
         bookmaker_id = _stringify(bookmaker.get("id") or bookmaker.get("bookmakerId") or bookmaker.get("bookmakerID"))
-        name = _extract_text(_extract_first(bookmaker, "name", "bookmakerName", "label"))
-        region = _extract_text(_extract_first(bookmaker, "region", "country", "jurisdiction"))
+        name = _intern(_extract_text(_extract_first(bookmaker, _BOOKMAKER_NAME_KEYS)))
+        region = _intern(_extract_text(_extract_first(bookmaker, _BOOKMAKER_REGION_KEYS)))
 
-        raw_markets = bookmaker.get("markets") or bookmaker.get("marketGroups") or bookmaker.get("groups")
-        raw_markets = _ensure_list(raw_markets)
-        expanded_markets: List[Dict[str, Any]] = []
+        # When every key is falsy the last value is kept as-is (there is no
+        # ``or []`` here), so ``"groups": {}`` still yields one empty market.
+        raw_markets = _first_list(bookmaker, _BOOKMAKER_MARKET_LIST_KEYS) or _ensure_list(
+            bookmaker.get(_BOOKMAKER_MARKET_LIST_KEYS[-1])
+        )
+        expanded_markets: List[Any] = []
         for candidate in raw_markets:
-            if isinstance(candidate, dict) and "markets" in candidate:
+            if type(candidate) is dict and "markets" in candidate:
                 expanded_markets.extend(_ensure_list(candidate.get("markets")))
             else:
                 expanded_markets.append(candidate)
-        markets = _normalise_markets(expanded_markets)
+        markets = _normalise_markets(expanded_markets, build)
 
         key = bookmaker_id or name or str(id(bookmaker))
-        if key not in bookmaker_map:
-            bookmaker_map[key] = {"id": bookmaker_id, "name": name, "region": region, "markets": []}
-            order.append(key)
+        if key not in ids:
+            ids[key] = bookmaker_id
+            names[key] = name
+            regions[key] = region
+            markets_by_key[key] = markets
+            continue
 
-        entry = bookmaker_map[key]
-        entry["name"] = entry["name"] or name
-        entry["region"] = entry["region"] or region
+        names[key] = names[key] or name
+        regions[key] = regions[key] or region
         if markets:
-            entry["markets"].extend(markets)
-
-    result: List[BookmakerOdds] = []
-    for key in order:
-        entry = bookmaker_map[key]
-        result.append(
-            BookmakerOdds(
-                id=entry["id"],
-                name=entry["name"],
-                region=entry["region"],
-                markets=entry["markets"],
-            )
+            markets_by_key[key].extend(markets)
+
+    return [
+        build(
+            BookmakerOdds,
+            id=ids[key],
+            name=names[key],
+            region=regions[key],
+            markets=markets_by_key[key],
         )
-    return result
+        for key in ids
+    ]
 
 
+@lru_cache(maxsize=256)
 def _format_market_name(betting_type: Optional[str], betting_scope: Optional[str]) -> Tuple[str, str]:
-    """Return a stable key and human friendly name for a market."""
+    """Return a stable key and human friendly name for a market.
+
+    Cached because a payload repeats the same handful of type/scope pairs for
+    every bookmaker.
+    """
 
     betting_type = (betting_type or "UNKNOWN").upper()
     betting_scope = (betting_scope or "UNKNOWN").upper()
     market_key = f"{betting_type}:{betting_scope}"
 
-    type_mapping = {
-        "HOME_DRAW_AWAY": "1X2",
-        "DOUBLE_CHANCE": "Double Chance",
-        "DRAW_NO_BET": "Draw No Bet",
-        "OVER_UNDER": "Over/Under",
-        "ASIAN_HANDICAP": "Asian Handicap",
-        "EUROPEAN_HANDICAP": "European Handicap",
-        "HALF_FULL_TIME": "Half-Time/Full-Time",
-        "CORRECT_SCORE": "Correct Score",
-        "BOTH_TEAMS_TO_SCORE": "Both Teams To Score",
-        "ODD_OR_EVEN": "Odd or Even",
-    }
-    scope_mapping = {
-        "FULL_TIME": "Full Time",
-        "FIRST_HALF": "First Half",
-        "SECOND_HALF": "Second Half",
-        "UNKNOWN": "Market",
-    }
-
-    type_label = type_mapping.get(betting_type, betting_type.replace("_", " ").title())
-    scope_label = scope_mapping.get(betting_scope, betting_scope.replace("_", " ").title())
+    type_label = _TYPE_MAPPING.get(betting_type, betting_type.replace("_", " ").title())
+    scope_label = _SCOPE_MAPPING.get(betting_scope, betting_scope.replace("_", " ").title())
 
     if scope_label == "Market":
         market_name = type_label
@@ -280,7 +445,7 @@ def _format_outcome_label(item: Dict[str, Any]) -> str:
             break
 
     handicap = item.get("handicap")
-    if isinstance(handicap, dict):
+    if type(handicap) is dict:
         handicap_value = _extract_text(handicap.get("value"))
         if handicap_value:
             parts.append(f"({handicap_value})")
@@ -296,8 +461,8 @@ def _format_outcome_label(item: Dict[str, Any]) -> str:
 def _map_graphql_bookmakers(node: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     details: Dict[str, Dict[str, Any]] = {}
     settings = _safe_dict(node.get("settings"))
-    for bookmaker_entry in _ensure_list(settings.get("bookmakers") or []):
-        if not isinstance(bookmaker_entry, dict):
+    for bookmaker_entry in _first_list(settings, _GRAPHQL_BOOKMAKER_LIST_KEYS):
+        if type(bookmaker_entry) is not dict:
             continue
         bookmaker_info = _safe_dict(bookmaker_entry.get("bookmaker"))
         bookmaker_id = _stringify(bookmaker_info.get("id") or bookmaker_entry.get("bookmakerId"))
@@ -305,16 +470,18 @@ def _map_graphql_bookmakers(node: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
             continue
         details[bookmaker_id] = {
             "id": bookmaker_id,
-            "name": _extract_text(bookmaker_info.get("name") or bookmaker_entry.get("name")),
+            "name": _intern(_extract_text(bookmaker_info.get("name") or bookmaker_entry.get("name"))),
             "region": None,
         }
     return details
 
 
-def _map_graphql_markets(node: Dict[str, Any]) -> Dict[str, List[OddsMarket]]:
-    aggregated: Dict[str, Dict[str, OddsMarket]] = {}
-    for market_entry in _ensure_list(node.get("odds") or []):
-        if not isinstance(market_entry, dict):
+def _map_graphql_markets(node: Dict[str, Any], build: _Builder = _construct) -> Dict[str, List[Any]]:
+    # (bookmaker id, market key) -> outcomes; markets are built once at the end.
+    by_key: Dict[Tuple[str, str], List[Any]] = {}
+    market_names: Dict[str, str] = {}
+    for market_entry in _first_list(node, _GRAPHQL_ODDS_LIST_KEYS):
+        if type(market_entry) is not dict:
             continue
 
         bookmaker_id = _stringify(market_entry.get("bookmakerId"))
@@ -324,19 +491,14 @@ def _map_graphql_markets(node: Dict[str, Any]) -> Dict[str, List[OddsMarket]]:
         market_key, market_name = _format_market_name(
             market_entry.get("bettingType"), market_entry.get("bettingScope")
         )
-
-        bookmaker_markets = aggregated.setdefault(bookmaker_id, {})
-        if market_key not in bookmaker_markets:
-            bookmaker_markets[market_key] = OddsMarket(
-                id=market_key,
-                name=market_name,
-                key=market_key,
-                outcomes=[],
-            )
-
-        outcomes = bookmaker_markets[market_key].outcomes
-        for outcome_entry in _ensure_list(market_entry.get("odds") or []):
-            if not isinstance(outcome_entry, dict):
+        market_names[market_key] = market_name
+
+        group_key = (bookmaker_id, market_key)
+        outcomes = by_key.get(group_key)
+        if outcomes is None:
+            outcomes = by_key[group_key] = []
+        for outcome_entry in _first_list(market_entry, _GRAPHQL_ODDS_LIST_KEYS):
+            if type(outcome_entry) is not dict:
                 continue
 
             outcome_id = _stringify(
@@ -346,10 +508,11 @@ def _map_graphql_markets(node: Dict[str, Any]) -> Dict[str, List[OddsMarket]]:
                 or f"{market_key}:{len(outcomes)}"
             )
 
-            outcome_label = _format_outcome_label(outcome_entry)
+            outcome_label = sys.intern(_format_outcome_label(outcome_entry))
 
             outcomes.append(
-                OddsOutcome(
+                build(
+                    OddsOutcome,
                     id=outcome_id,
                     label=outcome_label,
                     selection_key=outcome_id,
@@ -359,18 +522,27 @@ def _map_graphql_markets(node: Dict[str, Any]) -> Dict[str, List[OddsMarket]]:
                 )
             )
 
-    return {bookmaker_id: list(market_map.values()) for bookmaker_id, market_map in aggregated.items()}
+    markets_by_bookmaker: Dict[str, List[Any]] = {}
+    for (bookmaker_id, market_key), outcomes in by_key.items():
+        market = build(OddsMarket, id=market_key, name=market_names[market_key], key=market_key, outcomes=outcomes)
+        bookmaker_markets = markets_by_bookmaker.get(bookmaker_id)
+        if bookmaker_markets is None:
+            markets_by_bookmaker[bookmaker_id] = [market]
+        else:
+            bookmaker_markets.append(market)
+    return markets_by_bookmaker
 
 
-def _map_graphql_payload(event_id: str, node: Dict[str, Any]) -> OddsResponse:
+def _map_graphql_payload(event_id: str, node: Dict[str, Any], build: _Builder = _construct) -> Any:
     bookmaker_details = _map_graphql_bookmakers(node)
-    bookmaker_markets = _map_graphql_markets(node)
+    bookmaker_markets = _map_graphql_markets(node, build)
 
-    bookmakers: List[BookmakerOdds] = []
+    bookmakers: List[Any] = []
     for bookmaker_id, details in bookmaker_details.items():
         markets = bookmaker_markets.get(bookmaker_id, [])
         bookmakers.append(
-            BookmakerOdds(
+            build(
+                BookmakerOdds,
                 id=details.get("id"),
                 name=details.get("name"),
                 region=details.get("region"),
@@ -381,7 +553,8 @@ def _map_graphql_payload(event_id: str, node: Dict[str, Any]) -> OddsResponse:
     for bookmaker_id, markets in bookmaker_markets.items():
         if bookmaker_id not in bookmaker_details:
             bookmakers.append(
-                BookmakerOdds(
+                build(
+                    BookmakerOdds,
                     id=bookmaker_id,
                     name=None,
                     region=None,
@@ -400,93 +573,77 @@ def _map_graphql_payload(event_id: str, node: Dict[str, Any]) -> OddsResponse:
             event_info = candidate
             break
 
-    start_time = _parse_datetime(
-        _extract_first(event_info, "startTime", "startTimestamp", "kickoff", "startDate")
-    )
+    start_time = _parse_datetime(_extract_first(event_info, _EVENT_START_KEYS))
 
-    event = EventOdds(
+    event = build(
+        EventOdds,
         event_id=event_id,
-        event_name=_extract_text(
-            _extract_first(event_info, "name", "eventName", "shortName", "eventLabel", "eventTitle")
-        ),
-        competition_name=_extract_text(
-            _extract_first(event_info, "competition", "tournament", "league", "competitionName")
-        ),
+        event_name=_extract_text(_extract_first(event_info, _EVENT_NAME_KEYS)),
+        competition_name=_extract_text(_extract_first(event_info, _EVENT_COMPETITION_KEYS)),
         start_time=start_time,
         bookmakers=bookmakers,
     )
 
-    return OddsResponse(
+    return build(
+        OddsResponse,
         event=event,
-        retrieved_at=datetime.now(tz=timezone.utc),
+        retrieved_at=_cached_now(),
         source=_extract_text(node.get("source") or "livesport"),
     )
 
 
-def map_odds_payload(event_id: str, payload: Dict[str, Any]) -> OddsResponse:
+def map_odds_payload(event_id: str, payload: Optional[Dict[str, Any]]) -> OddsResponse:
+    return _map_payload(event_id, payload, _construct)
+
+
+def map_odds_payload_to_dict(event_id: str, payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Map ``payload`` straight to the JSON-ready shape of :class:`OddsResponse`.
+
+    Skips creating the schema models for callers that only serialise the result.
+    """
+
+    return _map_payload(event_id, payload, _as_dict)
+
+
+def _map_payload(event_id: str, payload: Optional[Dict[str, Any]], build: _Builder) -> Any:
     payload = payload or {}
 
     graphql_node = _safe_dict(payload.get("data")).get("findOddsByEventId")
-    if isinstance(graphql_node, dict):
-        return _map_graphql_payload(event_id=event_id, node=graphql_node)
+    if type(graphql_node) is dict:
+        return _map_graphql_payload(event_id=event_id, node=graphql_node, build=build)
 
     event_node = _extract_event_node(payload)
-    event_info = _safe_dict(_extract_first(event_node, "event", "fixture", "details") or event_node)
-    if not event_info:
-        for node in _walk_nodes(event_node):
-            if any(
-                key in node
-                for key in (
-                    "name",
-                    "eventName",
-                    "shortName",
-                    "competition",
-                    "tournament",
-                    "league",
-                    "competitionName",
-                    "startTime",
-                    "startTimestamp",
-                    "kickoff",
-                    "startDate",
-                )
-            ):
+    event_info = _safe_dict(_extract_first(event_node, _EVENT_INFO_NODE_KEYS) or event_node)
+    bookmakers = _normalise_bookmakers(_first_list(event_node, _BOOKMAKER_LIST_KEYS), build)
+
+    pending = (0 if event_info else _MATCH_EVENT_INFO) | (0 if bookmakers else _MATCH_BOOKMAKERS)
+    if pending:
+        # Look for whatever is still missing in a single traversal of the node.
+        for node, matched in _walk_collect(event_node, pending):
+            if matched & pending & _MATCH_EVENT_INFO:
                 event_info = node
-                break
-
-    bookmakers = _normalise_bookmakers(
-        _ensure_list(
-            event_node.get("bookmakers")
-            or event_node.get("bookmakerOdds")
-            or event_node.get("odds")
-            or []
-        )
-    )
-    if not bookmakers:
-        for node in _walk_nodes(event_node):
-            candidates = node.get("bookmakers") or node.get("bookmakerOdds") or node.get("odds")
-            if candidates:
-                bookmakers = _normalise_bookmakers(_ensure_list(candidates))
+                pending &= ~_MATCH_EVENT_INFO
+            if matched & pending & _MATCH_BOOKMAKERS:
+                bookmakers = _normalise_bookmakers(_first_list(node, _BOOKMAKER_LIST_KEYS), build)
                 if bookmakers:
-                    break
+                    pending &= ~_MATCH_BOOKMAKERS
+            if not pending:
+                break
 
-    start_time = _parse_datetime(
-        _extract_first(event_info, "startTime", "startTimestamp", "kickoff", "startDate")
-    )
+    start_time = _parse_datetime(_extract_first(event_info, _EVENT_START_KEYS))
 
-    event = EventOdds(
+    event = build(
+        EventOdds,
         event_id=event_id,
-        event_name=_extract_text(
-            _extract_first(event_info, "name", "eventName", "shortName", "eventLabel", "eventTitle")
-        ),
-        competition_name=_extract_text(
-            _extract_first(event_info, "competition", "tournament", "league", "competitionName")
-        ),
+        event_name=_extract_text(_extract_first(event_info, _EVENT_NAME_KEYS)),
+        competition_name=_extract_text(_extract_first(event_info, _EVENT_COMPETITION_KEYS)),
         start_time=start_time,
         bookmakers=bookmakers,
     )
 
-    return OddsResponse(
+    return build(
+        OddsResponse,
         event=event,
-        retrieved_at=datetime.now(tz=timezone.utc),
-        source=_extract_first(payload, "source", "provider", "origin") or "livesport",
+        retrieved_at=_cached_now(),
+        source=_extract_text(_extract_first(payload, _SOURCE_KEYS)) or "livesport",
     )
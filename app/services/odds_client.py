@@ -1,18 +1,38 @@
 import asyncio
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional
+from urllib.parse import quote_plus, urlencode
 
 import httpx
+import orjson
 
 
 RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+# Expired entries are swept from the cache once every this many writes.
+CACHE_SWEEP_INTERVAL = 256
+
+
+@lru_cache(maxsize=128)
+def _parse_http_date(value: str) -> Optional[float]:
+    """Parse an RFC 7231 HTTP-date to a POSIX timestamp, or ``None`` if invalid."""
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
 
 @dataclass
 class CachedOdds:
     payload: Any
-    expires_at: datetime
+    expires_at: float  # ``time.monotonic()`` deadline
 
 
 class OddsAPIError(Exception):
@@ -50,8 +70,8 @@ class OddsClient:
     """HTTP client responsible for retrieving odds from the upstream service.
 
     The client centralises timeout configuration, retry semantics and short-term
-    caching so that the FastAPI layer can remain thin. The in-memory cache keeps
-    recent responses for a configurable TTL, but it can be replaced with an
+    caching so that the FastAPI layer can remain thin. The in-memory LRU cache
+    keeps recent responses for a configurable TTL, but it can be replaced with an
     external store such as Redis or Azure Cache if the deployment environment
     requires horizontal scaling.
     """
@@ -67,6 +87,7 @@ class OddsClient:
         backoff_factor: float = 0.5,
         max_backoff: float = 8.0,
         cache_ttl: float = 30.0,
+        cache_max_entries: int = 4096,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._headers = headers or {}
@@ -76,8 +97,13 @@ class OddsClient:
         self._max_backoff = max_backoff
         self._cache_ttl = cache_ttl
         self._default_params = default_params or {}
-        self._cache: Dict[str, CachedOdds] = {}
-        self._cache_lock = asyncio.Lock()
+        # The query string only varies by ``eventId``, so encode the rest once and
+        # append the quoted event id per request.
+        self._url_prefix = f"{self._base_url}?{urlencode({**self._default_params, 'eventId': ''})}"
+        self._cache_max_entries = cache_max_entries
+        self._cache: "OrderedDict[str, CachedOdds]" = OrderedDict()
+        self._cache_writes = 0
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
         self._client = httpx.AsyncClient(timeout=self._timeout)
 
     async def aclose(self) -> None:
@@ -88,15 +114,32 @@ class OddsClient:
         if cached is not None:
             return cached
 
+        # Coalesce concurrent misses for the same event onto a single upstream
+        # fetch. It runs in its own task and every caller, the first included,
+        # awaits it through ``shield`` so one disconnecting client cannot cancel
+        # the fetch for the others.
+        task = self._inflight.get(event_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_odds(event_id))
+            self._inflight[event_id] = task
+            task.add_done_callback(lambda done: self._finish_inflight(event_id, done))
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, event_id: str, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(event_id) is task:
+            del self._inflight[event_id]
+        if not task.cancelled():
+            # Mark any exception as retrieved in case every caller went away.
+            task.exception()
+
+    async def _fetch_odds(self, event_id: str) -> Any:
         last_error: Optional[Exception] = None
 
         for attempt in range(self._max_retries + 1):
             try:
-                params = {**self._default_params, "eventId": event_id}
                 response = await self._client.get(
-                    self._base_url,
+                    self._url_prefix + quote_plus(event_id),
                     headers=self._headers,
-                    params=params,
                 )
             except httpx.RequestError as exc:  # network issue, retry if possible
                 last_error = exc
@@ -111,8 +154,8 @@ class OddsClient:
 
             if response.status_code == httpx.codes.OK:
                 try:
-                    payload = response.json()
-                except ValueError as exc:
+                    payload = orjson.loads(response.content)
+                except orjson.JSONDecodeError as exc:
                     raise OddsAPIError(
                         message="Upstream odds service returned invalid JSON.",
                         status_code=502,
@@ -161,22 +204,34 @@ class OddsClient:
     async def _get_cached(self, event_id: str) -> Optional[Any]:
         if self._cache_ttl <= 0:
             return None
-        async with self._cache_lock:
-            cached = self._cache.get(event_id)
-            if not cached:
-                return None
-            now = datetime.now(timezone.utc)
-            if cached.expires_at < now:
-                del self._cache[event_id]
-                return None
-            return cached.payload
+        # The cache takes no lock: neither reads nor writes await, so they cannot
+        # interleave on the event loop.
+        cached = self._cache.get(event_id)
+        if not cached:
+            return None
+        if cached.expires_at < time.monotonic():
+            self._cache.pop(event_id, None)
+            return None
+        self._cache.move_to_end(event_id)
+        return cached.payload
 
     async def _set_cache(self, event_id: str, payload: Any) -> None:
         if self._cache_ttl <= 0:
             return
-        async with self._cache_lock:
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=self._cache_ttl)
-            self._cache[event_id] = CachedOdds(payload=payload, expires_at=expires_at)
+        now = time.monotonic()
+        self._cache[event_id] = CachedOdds(payload=payload, expires_at=now + self._cache_ttl)
+        self._cache.move_to_end(event_id)
+        while len(self._cache) > self._cache_max_entries:
+            self._cache.popitem(last=False)
+
+        self._cache_writes += 1
+        if self._cache_writes % CACHE_SWEEP_INTERVAL == 0:
+            self._evict_expired(now)
+
+    def _evict_expired(self, now: float) -> None:
+        for event_id, cached in list(self._cache.items()):
+            if cached.expires_at < now:
+                del self._cache[event_id]
 
     def _compute_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
         if retry_after is not None:
@@ -193,16 +248,10 @@ class OddsClient:
             return float(header)
         except ValueError:
             # Support HTTP-date formatted values (RFC 7231)
-            from email.utils import parsedate_to_datetime
-
-            try:
-                dt = parsedate_to_datetime(header)
-            except (TypeError, ValueError):
+            retry_at = _parse_http_date(header)
+            if retry_at is None:
                 return None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            delta = dt - datetime.now(timezone.utc)
-            return max(delta.total_seconds(), 0.0)
+            return max(retry_at - time.time(), 0.0)
 
 
 def build_odds_client() -> OddsClient:
@@ -0,0 +1,16 @@
+"""Optional build script that compiles the odds mapper with mypyc.
+
+The service runs unchanged from source. Building the extension in place with
+``python setup.py build_ext --inplace`` drops a compiled ``app.services.odds``
+next to ``odds.py``; Python imports it in preference to the pure-Python module,
+and deleting the ``.so`` files falls back to the source version.
+"""
+from setuptools import setup
+
+from mypyc.build import mypycify
+
+setup(
+    name="fastapi-flashscore",
+    py_modules=[],
+    ext_modules=mypycify(["app/services/odds.py"]),
+)
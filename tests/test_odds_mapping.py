@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import pytest
+
+from app.services.odds import map_odds_payload, map_odds_payload_to_dict
+
+
+GRAPHQL_PAYLOAD = {
+    "data": {
+        "findOddsByEventId": {
+            "settings": {
+                "bookmakers": [
+                    {"bookmaker": {"id": 16, "name": "bet365"}},
+                    {"bookmaker": {"id": 5, "name": "Tipsport"}},
+                ]
+            },
+            "event": {
+                "name": "A vs B",
+                "competition": {"name": "League"},
+                "startTime": "2024-05-01T18:30:00Z",
+            },
+            "odds": [
+                {
+                    "bookmakerId": 16,
+                    "bettingType": "HOME_DRAW_AWAY",
+                    "bettingScope": "FULL_TIME",
+                    "odds": [
+                        {"eventParticipantId": "p1", "value": "1.85"},
+                        {"selection": "DRAW", "value": 3.4},
+                        {"eventParticipantId": "p2", "value": "4.2", "probability": "0.2"},
+                    ],
+                },
+                {
+                    "bookmakerId": 16,
+                    "bettingType": "OVER_UNDER",
+                    "bettingScope": "FIRST_HALF",
+                    "odds": [
+                        {"selection": "OVER", "handicap": {"value": "2.5"}, "value": "1.9"},
+                        {"selection": "UNDER", "handicap": {"value": "2.5"}, "value": ""},
+                    ],
+                },
+            ],
+        }
+    }
+}
+
+GENERIC_PAYLOAD = {
+    "provider": "prov",
+    "data": {
+        "wrapper": {
+            "details": {"eventName": "C vs D", "tournament": "Cup", "startTimestamp": 1714588200000},
+            "bookmakerOdds": [
+                {
+                    "bookmakerId": 1,
+                    "bookmakerName": {"text": "One"},
+                    "country": "CZ",
+                    "marketGroups": [
+                        {
+                            "markets": [
+                                {
+                                    "marketId": 10,
+                                    "marketName": "Winner",
+                                    "marketKey": "w",
+                                    "selections": [
+                                        {"outcomeId": 1, "label": "Home", "decimalOdds": "1.5", "fractionalOdds": "1/2"},
+                                        {"id": 2, "displayName": "Away", "value": 2, "impliedProbability": 0.4},
+                                    ],
+                                }
+                            ]
+                        },
+                        {"id": 11, "name": "Total", "outcomes": {"name": "Over", "oddsDecimal": "N/A"}},
+                    ],
+                },
+                {"name": "NoId", "markets": []},
+            ],
+        }
+    },
+}
+
+# A shallow event node must win over a deeper node that merely carries an
+# ``odds`` key.
+NESTED_SIGNAL_PAYLOAD = {
+    "data": {
+        "meta": {"info": {"odds": "n/a"}},
+        "payload": {"name": "A v B", "bookmakers": [{"id": "1", "name": "One", "markets": []}]},
+    }
+}
+
+EMPTY_GROUPS_PAYLOAD = {"bookmakers": [{"id": "1", "groups": {}}]}
+
+SAMPLE_PAYLOADS = {
+    "graphql": GRAPHQL_PAYLOAD,
+    "generic": GENERIC_PAYLOAD,
+    "nested_signal": NESTED_SIGNAL_PAYLOAD,
+    "empty_groups": EMPTY_GROUPS_PAYLOAD,
+    "empty": {},
+    "none": None,
+}
+
+
+def _dump(response: Any) -> Dict[str, Any]:
+    dump = getattr(response, "model_dump", None) or response.dict
+    return dump()
+
+
+@pytest.mark.parametrize("payload", SAMPLE_PAYLOADS.values(), ids=SAMPLE_PAYLOADS.keys())
+def test_dict_mapping_matches_model_mapping(payload: Any) -> None:
+    from_model = _dump(map_odds_payload("EV1", payload))
+    from_dict = map_odds_payload_to_dict("EV1", payload)
+
+    # ``retrieved_at`` is sampled independently by each call.
+    from_model.pop("retrieved_at")
+    from_dict.pop("retrieved_at")
+    assert from_dict == from_model
+
+
+def test_shallowest_event_node_is_used() -> None:
+    event = map_odds_payload("EV1", NESTED_SIGNAL_PAYLOAD).event
+
+    assert event.event_name == "A v B"
+    assert [bookmaker.name for bookmaker in event.bookmakers] == ["One"]
+
+
+def test_empty_market_group_yields_one_empty_market() -> None:
+    (bookmaker,) = map_odds_payload("EV1", EMPTY_GROUPS_PAYLOAD).event.bookmakers
+
+    assert len(bookmaker.markets) == 1
+    assert bookmaker.markets[0].outcomes == []